@@ -7,13 +7,23 @@ It supports extracting archive files, grouping files into directories, and perfo
 
 Key Features:
 -------------
-1. **Archive Support**: Extracts `.zip`, `.tar`, `.7z`, `.rar`, `.gz`, `.bz2`, and `.xz` files.
+1. **Archive Support**: Extracts `.zip`, `.tar`, `.7z`, `.rar`, `.gz`, `.bz2`, and `.xz` files, and unpacks
+   compressed tarballs (`.tar.gz`/`.tgz`, `.tar.bz2`/`.tbz2`, `.tar.xz`/`.txz`). Files without an extension
+   are probed for tar and ZIP content; executables are moved, never unpacked.
+   Large `.gz`/`.bz2` files are decompressed in parallel when the optional `rapidgzip`/`indexed_bzip2`
+   packages are installed. Archives over 256 MiB (other than `.zip`, whose members are extracted in
+   parallel) are handed to the system `tar`, `pigz`, `pbzip2`, or `xz` tools when they are on `PATH`,
+   falling back to the Python handlers otherwise.
 2. **File Grouping**: Groups files based on simplified names (e.g., library names and versions).
-3. **Integrity Check**: Computes MD5, SHA256, and SHA512 hashes for files.
+3. **Integrity Check**: Computes SHA256 (hardware-accelerated on CPUs with SHA extensions) and SHA512 hashes
+   for files, or a fast BLAKE3 digest.
 4. **Simulation Mode**: Allows a dry run to see what actions would be taken without making changes.
-5. **Concurrency**: Uses multithreading for faster processing of multiple files.
-6. **Logging**: Logs operations with rotating file support to avoid bloated log files.
-7. **Retry Mechanism**: Retries archive extraction up to 3 times in case of failure.
+5. **Concurrency**: Decompresses archives in a process pool so CPU-bound work scales across cores, while
+   moves and plain `.tar` extraction run on a thread pool in the main process.
+6. **Logging**: Logs operations with rotating file support to avoid bloated log files. Records are queued
+   and written by a background listener so workers never block on log I/O.
+7. **Retry Mechanism**: Retries archive extraction up to 3 times, with exponential backoff, on transient I/O errors.
+   Corrupt archives and wrong passwords fail immediately.
 8. **Password-Protected Archives**: Supports archives with optional passwords.
 
 Command Template:
@@ -26,21 +36,32 @@ Variables in Config File (`config.yaml`):
 - **output_dir**: The directory where organized files will be placed.
 - **simulate**: (Optional) `True` to simulate actions without making changes.
 - **integrity**: (Optional) `True` to enable file integrity checks.
+- **integrity_algo**: (Optional) `crypto` for SHA256/SHA512 (default) or `blake3` for a much faster
+  multi-threaded BLAKE3 digest (requires the optional `blake3` package).
 - **password**: (Optional) Password for password-protected archives. Use `PROMPT` to enter manually.
-- **file_filter**: (Optional) Regex pattern to filter files.
-- **max_threads**: (Optional) Maximum number of threads for processing files.
+- **file_filter**: (Optional) Regex pattern to filter files. Hidden files are always skipped.
+- **max_threads**: (Optional) Maximum number of files processed at once, shared between the worker processes
+  for compressed archives and the threads for everything else.
 - **log_level**: (Optional) Logging verbosity level (DEBUG, INFO, WARNING, ERROR).
 """
 
 import os
+import io
+import stat
 import re
 import tarfile
 import zipfile
+import errno
 import hashlib
+import mmap
 import logging
 import shutil
+import tempfile
 import concurrent.futures
-from typing import Optional, Dict
+import functools
+import itertools
+import operator
+from typing import Optional, Dict, List, Set, Tuple, NamedTuple, Callable, Iterable, Iterator
 from tqdm import tqdm
 from pathlib import Path
 import yaml
@@ -50,35 +71,209 @@ import gzip
 import bz2
 import lzma
 from termcolor import colored
-from retry import retry
 import multiprocessing
 import getpass
-from logging.handlers import RotatingFileHandler
+import time
+import subprocess
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import atexit
 import argparse
 
+try:
+    import fcntl  # Not available on Windows; only used for reflink copies
+except ImportError:
+    fcntl = None
+
+try:
+    import blake3  # Optional: fast tree-hashed digests for `integrity_algo: blake3`
+except ImportError:
+    blake3 = None
+
+try:
+    import rapidgzip  # Optional: multi-threaded gzip decompression
+except ImportError:
+    rapidgzip = None
+
+try:
+    import indexed_bzip2  # Optional: multi-threaded bzip2 decompression
+except ImportError:
+    indexed_bzip2 = None
+
+# Open gzip files with the parallel decoder when available
+def open_gzip(file_path, mode: str = "r"):
+    """
+    Opens a gzip file, using `rapidgzip` to decode blocks across `EXTRACT_THREADS` threads when it is installed.
+
+    Args:
+        file_path: Path to the file, or an already open binary file object.
+        mode (str): Open mode, only reading is supported by the parallel decoder.
+
+    Returns:
+        A readable file object yielding the decompressed data.
+    """
+    if rapidgzip is not None and isinstance(file_path, (str, os.PathLike)):
+        return rapidgzip.open(file_path, parallelization=EXTRACT_THREADS)
+    return gzip.open(file_path, mode)
+
+# Open bzip2 files with the parallel decoder when available
+def open_bz2(file_path, mode: str = "r"):
+    """
+    Opens a bzip2 file, using `indexed_bzip2` to decode blocks across `EXTRACT_THREADS` threads when it is installed.
+
+    Args:
+        file_path: Path to the file, or an already open binary file object.
+        mode (str): Open mode, only reading is supported by the parallel decoder.
+
+    Returns:
+        A readable file object yielding the decompressed data.
+    """
+    if indexed_bzip2 is not None and isinstance(file_path, (str, os.PathLike)):
+        return indexed_bzip2.open(file_path, parallelization=EXTRACT_THREADS)
+    return bz2.open(file_path, mode)
+
+# Read size for tar archives; tarfile's default of 20 records (10 KiB) means many small reads
+TAR_BUFFER_SIZE = 1024 * 1024
+
+# Open tar archives for sequential extraction
+def open_tar(file_path, mode: str = "r"):
+    """
+    Opens a plain or compressed tar archive in stream mode with a large read buffer. Extraction
+    reads every member in order, so stream mode avoids seeking back through compressed data.
+
+    Args:
+        file_path: Path to the archive, or an already open binary file object.
+        mode (str): Open mode, only reading is supported.
+
+    Returns:
+        tarfile.TarFile: The opened archive.
+    """
+    if isinstance(file_path, (str, os.PathLike)):
+        return tarfile.open(file_path, mode="r|*", bufsize=TAR_BUFFER_SIZE)
+    return tarfile.open(fileobj=file_path, mode="r|*", bufsize=TAR_BUFFER_SIZE)
+
 # Global mapping of archive handlers for various formats
 ARCHIVE_HANDLERS = {
-    ".tar": tarfile.open,
+    ".tar": open_tar,
+    ".tar.gz": open_tar,
+    ".tgz": open_tar,
+    ".tar.bz2": open_tar,
+    ".tbz2": open_tar,
+    ".tar.xz": open_tar,
+    ".txz": open_tar,
     ".zip": zipfile.ZipFile,
     ".7z": py7zr.SevenZipFile,
     ".rar": rarfile.RarFile,
-    ".gz": gzip.open,
-    ".bz2": bz2.open,
+    ".gz": open_gzip,
+    ".bz2": open_bz2,
     ".xz": lzma.open,
 }
 
+# Compressed formats whose extraction is CPU-bound and therefore runs in worker processes
+CPU_BOUND_ARCHIVES = set(ARCHIVE_HANDLERS) - {".tar"}
+
+# Tarballs, plain or compressed; `tarfile` detects the compression itself
+TAR_ARCHIVES = {extension for extension, handler in ARCHIVE_HANDLERS.items() if handler is open_tar}
+
+# Archive formats that are read front-to-back, so they can be hashed while extracting
+STREAMING_ARCHIVES = TAR_ARCHIVES | {".gz", ".bz2", ".xz"}
+
+# Read size used when draining archives for integrity hashes
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Buffer size for writing decompressed single-stream archives
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Archives larger than this are extracted with system tools when available
+LARGE_ARCHIVE_SIZE = 256 * 1024 * 1024
+
+# System commands for extracting large archives; single-stream formats decompress to stdout.
+# `{threads}` is the calling worker's `EXTRACT_THREADS` budget. ZIP files are not listed: `unzip`
+# is single-threaded, whereas `extract_zip_members` decompresses members in parallel
+CLI_EXTRACTORS = {
+    **{extension: ["tar", "-xf", "{file}", "-C", "{dest}"] for extension in TAR_ARCHIVES},
+    ".gz": ["pigz", "-p", "{threads}", "-dc", "{file}"],
+    ".bz2": ["pbzip2", "-p{threads}", "-dc", "{file}"],
+    ".xz": ["xz", "-T{threads}", "-dc", "{file}"],
+}
+
+# Parallel decompressors passed to `tar -I` for compressed tarballs when they are on `PATH`;
+# otherwise `tar` falls back to its single-threaded built-in decompression
+TAR_DECOMPRESSORS = {
+    ".tar.gz": "pigz -p {threads}",
+    ".tgz": "pigz -p {threads}",
+    ".tar.bz2": "pbzip2 -p{threads}",
+    ".tbz2": "pbzip2 -p{threads}",
+    ".tar.xz": "xz -T{threads}",
+    ".txz": "xz -T{threads}",
+}
+
+# Local file header that starts a plain ZIP archive
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Extraction attempts, and the errno values worth retrying because they are usually transient
+EXTRACT_ATTEMPTS = 3
+TRANSIENT_ERRNOS = {errno.EAGAIN, errno.EINTR, errno.EBUSY, errno.EIO, errno.ETIMEDOUT}
+
+# Threads each worker process may use for parallel decompression and ZIP member extraction
+EXTRACT_THREADS = multiprocessing.cpu_count()
+
+# ioctl request cloning one file's extents into another (Linux FICLONE)
+FICLONE = 0x40049409
+
+# Queue feeding the background log listener, shared with worker processes
+LOG_QUEUE = None
+
+# Start method for worker processes. The log listener and thread pool are already running when the
+# first worker starts, and forking a multi-threaded process can leave locks held in the child, so
+# workers are forked from a clean server process where supported
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Pattern splitting a file name into library name and version for grouping. The separator and
+# version are matched as one optional unit, so the engine never backtracks into the name, and the
+# match stops after the version instead of scanning the rest of the file name.
+NAME_PATTERN = re.compile(r"([a-zA-Z0-9]+)(?:[-_]([0-9]+(?:\.[0-9]+)*))?")
+
 # Default configurations
 DEFAULT_CONFIG = {
     "base_dir": "~/Downloads",  # Default directory
     "output_dir": "~/Organized_Files",
     "simulate": False,
     "integrity": False,
+    "integrity_algo": "crypto",
     "password": None,
     "file_filter": ".*",
     "max_threads": 4,
     "log_level": "INFO",
 }
 
+# Picklable description of a file handed to worker processes
+class FileItem(NamedTuple):
+    """
+    Minimal file description passed to worker processes (`os.DirEntry` cannot be pickled).
+
+    Attributes:
+        path (str): Full path to the file.
+        name (str): File name without its directory.
+        size (int): File size in bytes, used to schedule large files first.
+    """
+    path: str
+    name: str
+    size: int
+
+# Work unit prepared in the main process before dispatch
+class Job(NamedTuple):
+    """
+    A file together with everything decided about it up front, so workers only do the I/O.
+
+    Attributes:
+        item (FileItem): File to process.
+        folder (Path): Specific folder the file is organized into.
+        kind (Optional[str]): Archive extension from `classify_archive`, or None for plain files.
+    """
+    item: FileItem
+    folder: Path
+    kind: Optional[str]
+
 # Dynamically resolve the base directory to handle case sensitivity
 def resolve_base_dir(base_dir: str) -> Path:
     """
@@ -105,31 +300,44 @@ def resolve_base_dir(base_dir: str) -> Path:
 # Logging configuration with rotating file support
 def configure_logging(log_level: str, log_file: Optional[str] = None) -> None:
     """
-    Configures logging for the script.
+    Configures logging for the script. Loggers only enqueue records; a `QueueListener` thread owns the
+    console and file handlers and performs the writes, so workers never block on log I/O.
 
     Args:
         log_level (str): Logging level (e.g., DEBUG, INFO, WARNING, ERROR).
         log_file (Optional[str]): File to store logs. If None, logs are printed to the console.
     """
-    log_format = "%(asctime)s - %(levelname)s - %(message)s"
+    global LOG_QUEUE
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     log_level = getattr(logging, log_level.upper(), logging.WARNING)
     handlers = [logging.StreamHandler()]
 
     if log_file:
         handlers.append(RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # A multiprocessing queue so records from pool workers reach the same listener; created in the
+    # workers' context so its lock can be handed to them
+    LOG_QUEUE = multiprocessing.get_context(WORKER_START_METHOD).Queue()
+    listener = QueueListener(LOG_QUEUE, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
-    logging.basicConfig(level=log_level, format=log_format, handlers=handlers)
+    # The listener's handlers apply the real format; the queue carries the bare message
+    logging.basicConfig(level=log_level, format="%(message)s", handlers=[QueueHandler(LOG_QUEUE)])
 
 # Validate configuration for required keys and directory validity
 def validate_config(config: Dict) -> None:
     """
-    Validates the configuration file for required keys and valid directories.
+    Validates the configuration file for required keys, valid directories, and a usable integrity algorithm.
 
     Args:
         config (Dict): Configuration dictionary loaded from `config.yaml`.
 
     Raises:
-        ValueError: If a required key is missing or a directory path is invalid.
+        ValueError: If a required key is missing, a directory path is invalid, or integrity checks are
+            enabled with an unknown algorithm or without the `blake3` package.
     """
     required_keys = ["base_dir", "output_dir"]
     for key in required_keys:
@@ -137,6 +345,9 @@ def validate_config(config: Dict) -> None:
             raise ValueError(f"Missing required configuration key: {key}")
     if not Path(config["output_dir"]).expanduser().is_dir():
         raise ValueError("Invalid output directory path.")
+    if config.get("integrity", False):
+        # Fail before any file is touched rather than once per archive
+        create_hashes(config.get("integrity_algo", "crypto"))
 
 # Simplify file names for consistent grouping
 def simplify_name(file_name: str) -> str:
@@ -149,126 +360,736 @@ def simplify_name(file_name: str) -> str:
     Returns:
         str: Simplified name for grouping purposes.
     """
-    base_name = os.path.splitext(file_name)[0].replace(" ", "_")
-    match = re.match(r"([a-zA-Z0-9]+)[-_]?([0-9]+(?:\.[0-9]+)*)?[-_]?.*", base_name)
+    # Drop the extension unless everything before it is dots (e.g. `.bashrc`), without building
+    # intermediate tuples; str.replace returns the same object when there are no spaces
+    dot = file_name.rfind(".")
+    base_name = file_name[:dot] if dot > 0 and file_name.count(".", 0, dot) != dot else file_name
+    # Also drop the `.tar` of compound extensions such as `.tar.gz`
+    dot = base_name.rfind(".")
+    if dot > 0 and base_name[dot:].lower() == ".tar" and base_name.count(".", 0, dot) != dot:
+        base_name = base_name[:dot]
+    base_name = base_name.replace(" ", "_")
+    match = NAME_PATTERN.match(base_name)
     if match:
-        library, version = match.group(1), match.group(2) or ""
+        library, version = match.group(1, 2)
         return f"{library}-{version}" if version else library
     return base_name
 
-# Check if a file is a supported archive format
-def is_supported_archive(file_path: str) -> bool:
+# Classify a file by its archive extension
+def classify_archive(file_path: str) -> Optional[str]:
+    """
+    Determines the archive format of a file from its extension, recognizing compound tarball suffixes
+    such as `.tar.gz`. Only files without any extension are opened to probe for tar or ZIP content.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        Optional[str]: Lower-cased extension key into `ARCHIVE_HANDLERS`, or None if the file is not a
+        supported archive.
+    """
+    file_name = file_path.rpartition(os.sep)[2]
+    base_name, dot, extension = file_name.rpartition(".")
+    if not dot:
+        return probe_archive(file_path)
+    file_extension = "." + extension.lower()
+    if base_name[-4:].lower() == ".tar" and ".tar" + file_extension in ARCHIVE_HANDLERS:
+        return ".tar" + file_extension
+    return file_extension if file_extension in ARCHIVE_HANDLERS else None
+
+# Detect the archive format of a file without an extension
+def probe_archive(file_path: str) -> Optional[str]:
     """
-    Determines if a file is a supported archive format.
+    Detects tar (plain or compressed) and ZIP archives by their contents. Only regular files are
+    opened, so FIFOs, sockets, and device nodes cannot block the scan. Executables are never
+    treated as archives, and ZIP files must start with a local file header: self-extracting and
+    zipapp programs (e.g. `yt-dlp`) carry a stub before the ZIP data and are moved as-is.
 
     Args:
         file_path (str): Path to the file.
 
     Returns:
-        bool: True if the file is a supported archive, False otherwise.
+        Optional[str]: `.tar` or `.zip`, or None if the file is neither or cannot be read.
+    """
+    try:
+        mode = os.stat(file_path).st_mode
+        if not stat.S_ISREG(mode) or mode & 0o111:
+            return None
+        with open(file_path, "rb") as f:
+            if f.read(4) == ZIP_SIGNATURE:
+                return ".zip"
+        if tarfile.is_tarfile(file_path):
+            return ".tar"
+    except OSError:
+        pass
+    return None
+
+# Resolve the destination folder for a file
+def target_folder(output_dir: Path, file_name: str) -> Path:
+    """
+    Determines the folder a file is organized into: a group folder named after the library, with a
+    specific folder for the simplified name inside it (e.g. `SDL2/SDL2-2.0.1`).
+
+    Args:
+        output_dir (Path): Base output directory for organized files.
+        file_name (str): Name of the file being organized.
+
+    Returns:
+        Path: The specific folder for the file.
     """
-    return Path(file_path).suffix.lower() in ARCHIVE_HANDLERS
+    folder_name = simplify_name(file_name)
+    return output_dir / folder_name.partition("-")[0] / folder_name
 
 # Ensure required directories exist
-def ensure_directories_exist(group_folder: Path, specific_folder: Path) -> None:
+def ensure_directories_exist(folders: Iterable[Path]) -> Set[Path]:
+    """
+    Creates each distinct folder once, along with its group folder. Called from the main process before
+    any work is dispatched, so workers never issue mkdir calls. A folder that cannot be created is logged
+    and reported instead of aborting the run.
+
+    Args:
+        folders (Iterable[Path]): Specific folders files will be organized into.
+
+    Returns:
+        Set[Path]: Folders that could not be created.
+    """
+    failed = set()
+    for folder in set(folders):
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logging.error(f"Failed to create folder {folder}: {e}")
+            failed.add(folder)
+    return failed
+
+# Hint the kernel that a file will be read front-to-back
+def advise_sequential(fd: int) -> None:
+    """
+    Asks the kernel for aggressive read-ahead on a file about to be read sequentially. WILLNEED is
+    deliberately not used: with a length of 0 it would queue the whole file, flooding the page cache
+    with multi-GB archives long before they are read. A no-op on platforms without `posix_fadvise`.
+
+    Args:
+        fd (int): Open file descriptor.
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+
+# Release a fully read file from the page cache
+def advise_done(fd: int) -> None:
+    """
+    Tells the kernel a file's cached pages are no longer needed, so reading large archives does not
+    evict other processes' working sets. A no-op on platforms without `posix_fadvise`.
+
+    Args:
+        fd (int): Open file descriptor.
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError):
+        pass
+
+# Create fresh hash objects for an integrity algorithm
+def create_hashes(algo: str = "crypto") -> Dict[str, object]:
+    """
+    Creates the hash objects used for integrity checks.
+
+    Args:
+        algo (str): `crypto` for SHA256/SHA512, or `blake3` for a BLAKE3 digest.
+
+    Returns:
+        Dict[str, object]: Mapping of hash names to hash objects supporting `update` and `hexdigest`.
+
+    Raises:
+        ValueError: If the algorithm is unknown or `blake3` is not installed.
     """
-    Creates directories if they do not already exist.
+    if algo == "blake3":
+        if blake3 is None:
+            raise ValueError("integrity_algo 'blake3' requires the 'blake3' package.")
+        return {"BLAKE3": blake3.blake3(max_threads=blake3.blake3.AUTO)}
+    if algo != "crypto":
+        raise ValueError(f"Unsupported integrity algorithm: {algo}")
+    # OpenSSL dispatches SHA256 to the CPU's SHA extensions (SHA-NI, ARMv8 SHA2) when present
+    return {"SHA256": hashlib.sha256(), "SHA512": hashlib.sha512()}
+
+# File wrapper that hashes every byte read through it
+class HashingReader(io.RawIOBase):
+    """
+    Read-only wrapper that feeds every byte read from the underlying file into a set of hashes.
+
+    Args:
+        raw (io.RawIOBase): Unbuffered binary file to read from; callers wrap the reader in a large
+            `io.BufferedReader` instead.
+        hashes (Dict[str, object]): Hash objects to update, as returned by `create_hashes`.
+    """
+
+    def __init__(self, raw, hashes: Dict[str, object]) -> None:
+        super().__init__()
+        self.raw = raw
+        self.hashes = hashes
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self.raw.readinto(buffer)
+        if n:
+            chunk = memoryview(buffer)[:n]
+            for hash_obj in self.hashes.values():
+                hash_obj.update(chunk)
+        return n
+
+    def drain(self) -> None:
+        """
+        Hashes any bytes the archive handler left unread so the digests cover the whole file.
+        """
+        for chunk in iter(lambda: self.raw.read(HASH_CHUNK_SIZE), b""):
+            for hash_obj in self.hashes.values():
+                hash_obj.update(chunk)
+
+# Move a file, renaming in place when possible
+def move_file(src: str, dst: Path) -> None:
+    """
+    Moves a file with a single rename when source and destination share a filesystem,
+    falling back to a reflink clone and then a kernel-side copy (`copy_file_range`/`sendfile`)
+    followed by removal. Cross-filesystem copies go to a uniquely named temporary file first (its name
+    does not grow with `dst.name`, so long names stay within NAME_MAX) and are renamed into place
+    atomically, so an interrupted move never leaves a truncated file at `dst`. Symlinks are
+    recreated rather than copied, so they keep pointing at their target (even a missing one).
+
+    Args:
+        src (str): Path to the file to move.
+        dst (Path): Destination file path.
+    """
+    try:
+        # os.replace rather than os.rename: same semantics on POSIX, and it also overwrites on Windows
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        fd, partial = tempfile.mkstemp(dir=dst.parent, prefix=".", suffix=".part")
+        os.close(fd)
+        partial = Path(partial)
+        try:
+            if os.path.islink(src):
+                partial.unlink()
+                os.symlink(os.readlink(src), partial)
+            else:
+                if not reflink_file(src, partial):
+                    shutil.copyfile(src, partial)
+                shutil.copystat(src, partial)
+            os.replace(partial, dst)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        os.unlink(src)
+
+# Clone a file's data without copying it
+def reflink_file(src: str, dst: Path) -> bool:
+    """
+    Clones `src` into `dst` with the FICLONE ioctl, sharing data blocks instead of copying them.
+    This works across mount points and subvolumes of the same Btrfs/XFS filesystem, where
+    `os.rename` fails with EXDEV.
 
     Args:
-        group_folder (Path): General group directory path.
-        specific_folder (Path): Specific file group directory path.
+        src (str): Path to the source file.
+        dst (Path): Destination file path.
+
+    Returns:
+        bool: True if the clone succeeded, False if it is unsupported and a regular copy is needed.
     """
-    group_folder.mkdir(parents=True, exist_ok=True)
-    specific_folder.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        return False
+    with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+        try:
+            fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+            return True
+        except OSError:
+            return False
 
-# Extract archive files with retry support
-@retry(Exception, tries=3, delay=2)
-def extract_file(file_path: str, extract_to: str, password: Optional[str] = None) -> None:
+# Extract archive files, retrying transient I/O errors
+def extract_file(
+    file_path: str,
+    extract_to: str,
+    password: Optional[str] = None,
+    hashes: Optional[Dict[str, object]] = None,
+    file_extension: Optional[str] = None
+) -> None:
     """
-    Extracts supported archive files to a specified directory.
+    Extracts supported archive files to a specified directory. Transient I/O errors (see `TRANSIENT_ERRNOS`)
+    are retried with exponential backoff; any other failure is logged without retrying.
 
     Args:
         file_path (str): Path to the archive file.
         extract_to (str): Directory to extract contents to.
         password (Optional[str]): Password for encrypted archives, if any.
+        hashes (Optional[Dict[str, object]]): Hash objects to update with the archive bytes while
+            extracting. Only supported for formats in `STREAMING_ARCHIVES`.
+        file_extension (Optional[str]): Archive extension already returned by `classify_archive`.
+            Detected from `file_path` when omitted.
     """
-    file_extension = Path(file_path).suffix.lower()
+    file_extension = file_extension or classify_archive(file_path)
 
-    if file_extension not in ARCHIVE_HANDLERS:
+    if file_extension is None:
         logging.error(f"Unsupported archive format: {file_path}")
         return
 
-    try:
+    initial_hashes = {key: hash_obj.copy() for key, hash_obj in hashes.items()} if hashes is not None else None
+    for attempt in range(EXTRACT_ATTEMPTS):
+        try:
+            extract_archive(file_path, extract_to, file_extension, password, hashes)
+            logging.info(f"Extracted: {file_path} to {extract_to}")
+            return
+        except OSError as e:
+            if e.errno not in TRANSIENT_ERRNOS or attempt == EXTRACT_ATTEMPTS - 1:
+                logging.error(f"Failed to extract {file_path}: {e}", exc_info=True)
+                return
+            delay = 2 ** attempt
+            logging.warning(f"Transient error extracting {file_path}, retrying in {delay}s: {e}")
+            time.sleep(delay)
+            if hashes is not None:
+                # Restart the digests so the retried read is not hashed twice
+                hashes.update({key: hash_obj.copy() for key, hash_obj in initial_hashes.items()})
+        except Exception as e:
+            logging.error(f"Failed to extract {file_path}: {e}", exc_info=True)
+            return
+
+# Extract an archive in a single attempt
+def extract_archive(
+    file_path: str,
+    extract_to: str,
+    file_extension: str,
+    password: Optional[str] = None,
+    hashes: Optional[Dict[str, object]] = None
+) -> None:
+    """
+    Extracts an archive once, raising on failure.
+
+    Args:
+        file_path (str): Path to the archive file.
+        extract_to (str): Directory to extract contents to.
+        file_extension (str): Lower-cased archive extension, a key of `ARCHIVE_HANDLERS`.
+        password (Optional[str]): Password for encrypted archives, if any.
+        hashes (Optional[Dict[str, object]]): Hash objects to update with the archive bytes while extracting.
+    """
+    if hashes is not None:
+        # Unbuffered: the 1 MiB BufferedReader around the HashingReader is the only buffering layer
+        with open(file_path, "rb", buffering=0) as raw:
+            advise_sequential(raw.fileno())
+            reader = HashingReader(raw, hashes)
+            try:
+                extract_stream(io.BufferedReader(reader, HASH_CHUNK_SIZE), file_path, extract_to, file_extension)
+            finally:
+                reader.drain()
+                advise_done(raw.fileno())
+    elif os.path.getsize(file_path) > LARGE_ARCHIVE_SIZE and extract_with_cli(
+        file_path, extract_to, file_extension, password
+    ):
+        logging.debug(f"Used {CLI_EXTRACTORS[file_extension][0]} to extract large archive {file_path}")
+    else:
         handler = ARCHIVE_HANDLERS[file_extension]
         with handler(file_path, 'r') as archive:
-            if hasattr(archive, 'extractall'):
-                archive.extractall(path=extract_to, pwd=password.encode() if password else None)
+            if file_extension == ".zip":
+                extract_zip_members(archive, extract_to, password)
+            elif hasattr(archive, 'extractall'):
+                if password:
+                    archive.extractall(path=extract_to, pwd=password.encode())
+                else:
+                    archive.extractall(path=extract_to)
             else:
                 output_path = Path(extract_to) / Path(file_path).stem
                 with open(output_path, 'wb') as f_out:
-                    shutil.copyfileobj(archive, f_out)
-        logging.info(f"Extracted: {file_path} to {extract_to}")
-    except Exception as e:
-        logging.error(f"Failed to extract {file_path}: {e}", exc_info=True)
+                    shutil.copyfileobj(archive, f_out, COPY_BUFFER_SIZE)
+
+# Extract an archive with an external command-line tool
+def extract_with_cli(file_path: str, extract_to: str, file_extension: str, password: Optional[str] = None) -> bool:
+    """
+    Extracts an archive with the matching tool from `CLI_EXTRACTORS`. The C tools use larger buffers
+    than the Python handlers and `pigz`/`pbzip2`/`xz` decompress on `EXTRACT_THREADS` cores, both for
+    single-stream archives and, through `tar -I`, for compressed tarballs (see `TAR_DECOMPRESSORS`).
+    Tools run in their own session with stdin closed, so none can stop to prompt on the terminal.
+
+    Args:
+        file_path (str): Path to the archive file.
+        extract_to (str): Directory to extract contents to.
+        file_extension (str): Lower-cased archive extension.
+        password (Optional[str]): Password for encrypted archives. Password-protected archives are
+            left to the Python handlers so the password never appears on a command line.
+
+    Returns:
+        bool: True if the archive was extracted, False if no suitable tool is available.
+
+    Raises:
+        subprocess.CalledProcessError: If the tool fails.
+    """
+    template = CLI_EXTRACTORS.get(file_extension)
+    if template is None or password or shutil.which(template[0]) is None:
+        return False
+    command = [arg.format(file=file_path, dest=extract_to, threads=EXTRACT_THREADS) for arg in template]
+    decompressor = TAR_DECOMPRESSORS.get(file_extension)
+    if decompressor is not None and shutil.which(decompressor.split()[0]) is not None:
+        command[1:1] = ["-I", decompressor.format(threads=EXTRACT_THREADS)]
+
+    if "{dest}" in template:
+        subprocess.run(
+            command, check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, start_new_session=True
+        )
+    else:
+        output_path = Path(extract_to) / Path(file_path).stem
+        with open(output_path, 'wb') as f_out:
+            subprocess.run(command, check=True, stdin=subprocess.DEVNULL, stdout=f_out, start_new_session=True)
+    return True
+
+# Extract ZIP members concurrently
+def extract_zip_members(archive: zipfile.ZipFile, extract_to: str, password: Optional[str] = None) -> None:
+    """
+    Extracts the members of an open ZIP archive across `EXTRACT_THREADS` threads. Each member is an
+    independent compressed stream and zlib releases the GIL, so members decompress in parallel.
+
+    Args:
+        archive (zipfile.ZipFile): Open ZIP archive.
+        extract_to (str): Directory to extract contents to.
+        password (Optional[str]): Password for encrypted archives, if any.
+    """
+    pwd = password.encode() if password else None
+    members = archive.infolist()
+    if EXTRACT_THREADS <= 1 or len(members) <= 1:
+        archive.extractall(path=extract_to, pwd=pwd)
+        return
+
+    # Create parent directories up front; zipfile's own makedirs is not safe to race
+    for info in members:
+        parts = [part for part in info.filename.split("/") if part not in ("", os.curdir, os.pardir)]
+        parents = parts if info.is_dir() else parts[:-1]
+        if parents:
+            os.makedirs(os.path.join(extract_to, *parents), exist_ok=True)
+
+    files = [info for info in members if not info.is_dir()]
+    with concurrent.futures.ThreadPoolExecutor(min(EXTRACT_THREADS, len(files) or 1)) as pool:
+        for future in [pool.submit(archive.extract, info, extract_to, pwd) for info in files]:
+            future.result()
+
+# Set per-process state in pool workers
+def init_worker(extract_threads: int, log_queue=None, log_level: int = logging.INFO) -> None:
+    """
+    Initializes a worker process of the file-processing pool.
+
+    Args:
+        extract_threads (int): Threads this worker may use for parallel decompression and member
+            extraction, sized so that all workers together do not oversubscribe the CPUs.
+        log_queue (Optional[multiprocessing.Queue]): Queue of the parent's log listener. Attached when
+            the worker did not inherit the parent's logging setup (started with `forkserver` or `spawn`).
+        log_level (int): Logging level to use when attaching `log_queue`.
+    """
+    global EXTRACT_THREADS
+    EXTRACT_THREADS = extract_threads
+
+    root = logging.getLogger()
+    if log_queue is not None and not root.handlers:
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(log_level)
+
+# Extract a sequentially readable archive from an open file object
+def extract_stream(stream: io.BufferedIOBase, file_path: str, extract_to: str, file_extension: str) -> None:
+    """
+    Extracts a streaming archive (tarballs, `.gz`, `.bz2`, `.xz`) from an already open file object.
+
+    Args:
+        stream (io.BufferedIOBase): Open binary stream positioned at the start of the archive.
+        file_path (str): Original path of the archive, used to name single-stream output.
+        extract_to (str): Directory to extract contents to.
+        file_extension (str): Lower-cased archive extension.
+    """
+    if file_extension in TAR_ARCHIVES:
+        with open_tar(stream) as archive:
+            archive.extractall(path=extract_to)
+        return
+
+    output_path = Path(extract_to) / Path(file_path).stem
+    with ARCHIVE_HANDLERS[file_extension](stream, 'r') as archive, open(output_path, 'wb') as f_out:
+        shutil.copyfileobj(archive, f_out, COPY_BUFFER_SIZE)
 
 # Calculate file integrity checksums
-def integrity_check(file_path: str) -> Dict[str, str]:
+def integrity_check(file_path: str, algo: str = "crypto", release_cache: bool = True) -> Dict[str, str]:
     """
-    Calculates MD5, SHA256, and SHA512 hashes for a file.
+    Calculates SHA256 and SHA512 hashes for a file, or a single BLAKE3 hash.
 
     Args:
         file_path (str): Path to the file.
+        algo (str): `crypto` for SHA256/SHA512, or `blake3` for a BLAKE3 digest.
+        release_cache (bool): If True, drops the file from the page cache afterwards. Pass False when
+            another reader (e.g. a concurrent extraction) still needs it.
 
     Returns:
         Dict[str, str]: Dictionary of calculated hashes.
+
+    Raises:
+        ValueError: If the algorithm is unknown or `blake3` is not installed.
     """
-    hashes = {"MD5": hashlib.md5(), "SHA256": hashlib.sha256(), "SHA512": hashlib.sha512()}
+    hashes = create_hashes(algo)
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):  # Larger chunks for performance
-            for hash_obj in hashes.values():
-                hash_obj.update(chunk)
+        advise_sequential(f.fileno())
+        try:
+            if algo == "blake3":
+                hashes["BLAKE3"].update_mmap(file_path)
+            elif os.fstat(f.fileno()).st_size > 0:  # Empty files cannot be memory-mapped
+                # One C-level update per digest over a shared mapping; hashlib releases the GIL,
+                # so the digests run concurrently without a Python-level chunk loop
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        concurrent.futures.ThreadPoolExecutor(len(hashes)) as pool:
+                    concurrent.futures.wait([pool.submit(hash_obj.update, mapped) for hash_obj in hashes.values()])
+        finally:
+            if release_cache:
+                advise_done(f.fileno())
     return {key: hash_obj.hexdigest() for key, hash_obj in hashes.items()}
 
-# Process a single file for extraction, grouping, or moving
-def process_file(
-    item: os.DirEntry,
-    output_dir: Path,
+# Extract an archive into its group folder
+def extract_item(item: FileItem, specific_folder: Path, *, file_extension: str, password: Optional[str] = None) -> None:
+    """
+    Extracts an archive without integrity checks.
+
+    Args:
+        item (FileItem): Archive to extract.
+        specific_folder (Path): Destination folder.
+        file_extension (str): Archive extension, a key of `ARCHIVE_HANDLERS`.
+        password (Optional[str]): Password for password-protected archives, if any.
+    """
+    extract_file(item.path, str(specific_folder), password=password, file_extension=file_extension)
+
+# Extract a streaming archive while hashing it
+def extract_and_hash(
+    item: FileItem,
+    specific_folder: Path,
+    *,
+    file_extension: str,
+    password: Optional[str] = None,
+    integrity_algo: str = "crypto"
+) -> None:
+    """
+    Extracts a streaming archive (see `STREAMING_ARCHIVES`) and computes its checksums in the same read.
+
+    Args:
+        item (FileItem): Archive to extract.
+        specific_folder (Path): Destination folder.
+        file_extension (str): Archive extension, a key of `ARCHIVE_HANDLERS`.
+        password (Optional[str]): Password for password-protected archives, if any.
+        integrity_algo (str): Hash algorithm family used for integrity checks.
+    """
+    hashes = create_hashes(integrity_algo)
+    extract_file(item.path, str(specific_folder), password=password, hashes=hashes, file_extension=file_extension)
+    checksums = {key: hash_obj.hexdigest() for key, hash_obj in hashes.items()}
+    logging.info(f"Integrity check for {item.name}: {checksums}")
+
+# Extract an archive while hashing it on another thread
+def extract_and_verify(
+    item: FileItem,
+    specific_folder: Path,
+    *,
+    file_extension: str,
+    password: Optional[str] = None,
+    integrity_algo: str = "crypto"
+) -> None:
+    """
+    Extracts a random-access archive (`.zip`, `.7z`, `.rar`) while computing its checksums on a
+    separate thread. Hashing releases the GIL, so it overlaps the extraction and both read the
+    archive through the same page cache.
+
+    Args:
+        item (FileItem): Archive to extract.
+        specific_folder (Path): Destination folder.
+        file_extension (str): Archive extension, a key of `ARCHIVE_HANDLERS`.
+        password (Optional[str]): Password for password-protected archives, if any.
+        integrity_algo (str): Hash algorithm family used for integrity checks.
+    """
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        hashing = pool.submit(integrity_check, item.path, integrity_algo, release_cache=False)
+        extract_file(item.path, str(specific_folder), password=password, file_extension=file_extension)
+    checksums = hashing.result()
+    logging.info(f"Integrity check for {item.name}: {checksums}")
+
+# Move a non-archive file into its group folder
+def move_item(item: FileItem, specific_folder: Path) -> None:
+    """
+    Moves a file into its group folder.
+
+    Args:
+        item (FileItem): File to move.
+        specific_folder (Path): Destination folder.
+    """
+    move_file(item.path, specific_folder / item.name)
+
+# Log the action that would be taken in simulation mode
+def simulate_action(item: FileItem, specific_folder: Path, *, action: str) -> None:
+    """
+    Logs an action instead of performing it.
+
+    Args:
+        item (FileItem): File that would be processed.
+        specific_folder (Path): Destination folder.
+        action (str): Description of the skipped action, e.g. `extraction` or `move`.
+    """
+    logging.info(f"Simulating {action} of {item.name} to {specific_folder}")
+
+# Build the per-extension handlers for a run
+def build_dispatch(
     simulate: bool,
     integrity: bool,
-    password: Optional[str] = None
-) -> None:
+    password: Optional[str] = None,
+    integrity_algo: str = "crypto"
+) -> Dict[Optional[str], Callable[[FileItem, Path], None]]:
     """
-    Processes an individual file: extracts, moves, or logs based on configuration.
+    Resolves the run configuration into one specialized handler per archive extension, so each file
+    needs a single dictionary lookup instead of re-checking the options.
 
     Args:
-        item (os.DirEntry): File to process.
-        output_dir (Path): Base output directory for organized files.
-        simulate (bool): If True, simulates actions without making changes.
-        integrity (bool): If True, performs integrity checks.
+        simulate (bool): If True, handlers only log what they would do.
+        integrity (bool): If True, archive handlers also compute checksums.
         password (Optional[str]): Password for password-protected archives, if any.
+        integrity_algo (str): Hash algorithm family used for integrity checks.
+
+    Returns:
+        Dict[Optional[str], Callable[[FileItem, Path], None]]: Handlers keyed by archive extension,
+        with the `None` key handling non-archive files.
     """
-    try:
-        folder_name = simplify_name(item.name)
-        group_folder = output_dir / folder_name.split("-")[0]
-        specific_folder = group_folder / folder_name
-        ensure_directories_exist(group_folder, specific_folder)
-
-        if is_supported_archive(item.path):
-            if simulate:
-                logging.info(f"Simulating extraction of {item.name} to {specific_folder}")
-                return
-            extract_file(item.path, str(specific_folder), password=password)
-            if integrity:
-                checksums = integrity_check(item.path)
-                logging.info(f"Integrity check for {item.name}: {checksums}")
+    if simulate:
+        dispatch = {
+            file_extension: functools.partial(simulate_action, action="extraction")
+            for file_extension in ARCHIVE_HANDLERS
+        }
+        dispatch[None] = functools.partial(simulate_action, action="move")
+        return dispatch
+
+    dispatch = {}
+    for file_extension in ARCHIVE_HANDLERS:
+        if not integrity:
+            dispatch[file_extension] = functools.partial(
+                extract_item, file_extension=file_extension, password=password
+            )
         else:
-            destination = specific_folder / item.name
-            if simulate:
-                logging.info(f"Simulating move of {item.name} to {specific_folder}")
-                return
-            shutil.move(item.path, destination)
+            # Hash streaming archives during extraction instead of reading them a second time
+            handler = extract_and_hash if file_extension in STREAMING_ARCHIVES else extract_and_verify
+            dispatch[file_extension] = functools.partial(
+                handler, file_extension=file_extension, password=password, integrity_algo=integrity_algo
+            )
+    dispatch[None] = move_item
+    return dispatch
+
+# Process a single file for extraction, grouping, or moving
+def process_file(job: Job, *, dispatch: Dict[Optional[str], Callable[[FileItem, Path], None]]) -> None:
+    """
+    Processes an individual file: extracts, moves, or logs based on configuration.
+
+    Args:
+        job (Job): File to process, with its destination folder and archive kind already resolved.
+        dispatch (Dict[Optional[str], Callable[[FileItem, Path], None]]): Handlers from `build_dispatch`.
+    """
+    try:
+        dispatch[job.kind](job.item, job.folder)
     except Exception as e:
-        logging.error(f"Failed to process {item.name}: {e}", exc_info=True)
+        logging.error(f"Failed to process {job.item.name}: {e}", exc_info=True)
+
+# Resolve destinations and archive kinds for all files
+def plan_jobs(items: Iterable[FileItem], output_dir: Path) -> List[Job]:
+    """
+    Classifies every file and resolves its destination in the main process. This is pure Python work
+    that gains nothing from the pools, so workers receive ready-made jobs and only do the I/O.
+
+    Args:
+        items (Iterable[FileItem]): Files to process, in scheduling order.
+        output_dir (Path): Base output directory for organized files.
+
+    Returns:
+        List[Job]: One job per item, in the same order.
+    """
+    return [Job(item, target_folder(output_dir, item.name), classify_archive(item.path)) for item in items]
+
+# Lazily scan the base directory for files to organize
+def scan_files(base_dir: Path, file_filter: re.Pattern) -> Iterator[FileItem]:
+    """
+    Yields the visible files in `base_dir` matching `file_filter`, without keeping `os.DirEntry` objects
+    alive. Hidden files (names starting with `.`) are skipped. Name checks run first; `is_dir` is answered
+    from the directory entry's type and only costs a `stat` for symlinks. Dangling symlinks are yielded
+    with size 0 so they are still moved; files removed during the scan are skipped.
+
+    Args:
+        base_dir (Path): Directory to scan.
+        file_filter (re.Pattern): Compiled pattern file names must match.
+
+    Yields:
+        FileItem: Picklable description of each matching file.
+    """
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.name[0] != "." and file_filter.search(entry.name) and not entry.is_dir():
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    if not entry.is_symlink():
+                        continue
+                    size = 0
+                yield FileItem(entry.path, entry.name, size)
+
+# Divide the worker budget between the process and thread pools
+def split_workers(cpu_jobs: List[Job], io_jobs: List[Job], max_threads: int) -> Tuple[int, int]:
+    """
+    Splits `max_threads` between the process pool (compressed archives) and the thread pool (everything
+    else) in proportion to the bytes each will handle, since archive size rather than file count dominates
+    the run time. The two counts never add up to more than `max_threads`; with a budget of one, mixed work
+    all runs on a single thread.
+
+    Args:
+        cpu_jobs (List[Job]): Jobs meant for the process pool.
+        io_jobs (List[Job]): Jobs meant for the thread pool.
+        max_threads (int): Maximum number of files processed at once.
+
+    Returns:
+        Tuple[int, int]: Process and thread worker counts. A process count of 0 means `cpu_jobs` run on
+        the thread pool as well.
+    """
+    max_threads = max(1, max_threads)
+    if not cpu_jobs or (io_jobs and max_threads == 1):
+        return 0, min(len(cpu_jobs) + len(io_jobs), max_threads)
+    if not io_jobs:
+        return min(len(cpu_jobs), multiprocessing.cpu_count(), max_threads), 0
+    cpu_bytes = sum(job.item.size for job in cpu_jobs)
+    total_bytes = cpu_bytes + sum(job.item.size for job in io_jobs)
+    share = round(max_threads * cpu_bytes / total_bytes) if total_bytes else 1
+    process_workers = min(len(cpu_jobs), multiprocessing.cpu_count(), max_threads - 1, max(1, share))
+    return process_workers, min(len(io_jobs), max_threads - process_workers)
+
+# Run tasks with a bounded number of pending futures per executor
+def submit_bounded(
+    fn: Callable,
+    queues: Iterable[Tuple[concurrent.futures.Executor, Iterable, int]]
+) -> Iterator:
+    """
+    Submits `fn(item)` for the items of several queues, each bound to its own executor, keeping at most
+    `max_pending` futures outstanding per queue. An executor is refilled as soon as one of its own tasks
+    completes, so a long backlog for one pool never starves the other. Unlike `Executor.map`, which creates
+    a future for every item up front, memory stays bounded regardless of how many files are queued.
+
+    Args:
+        fn (Callable): Function called with each item.
+        queues (Iterable[Tuple[concurrent.futures.Executor, Iterable, int]]): Triples of the executor,
+            its items (consumed lazily in order), and its maximum number of submitted but unfinished tasks.
+
+    Yields:
+        Results of `fn`, in completion order.
+    """
+    pending = {}
+    for executor, items, max_pending in queues:
+        items = iter(items)
+        for item in itertools.islice(items, max_pending):
+            pending[executor.submit(fn, item)] = (executor, items)
+    while pending:
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            executor, items = pending.pop(future)
+            for item in itertools.islice(items, 1):
+                pending[executor.submit(fn, item)] = (executor, items)
+            yield future.result()
 
 # Main function for organizing downloads
 def organize_downloads(config: Dict) -> None:
@@ -283,6 +1104,7 @@ def organize_downloads(config: Dict) -> None:
     output_dir = Path(config["output_dir"]).expanduser()
     simulate = config.get("simulate", False)
     integrity = config.get("integrity", False)
+    integrity_algo = config.get("integrity_algo", "crypto")
     password = config.get("password", None)
     if password == "PROMPT":
         password = getpass.getpass("Enter archive password: ")
@@ -293,18 +1115,45 @@ def organize_downloads(config: Dict) -> None:
         logging.error(colored(f"Base directory '{base_dir}' is invalid or inaccessible.", "red"))
         return
 
-    # Scan items and process
-    items = [item for item in os.scandir(base_dir) if not item.is_dir() and file_filter.search(item.name)]
-    max_threads = min(len(items), multiprocessing.cpu_count(), config.get("max_threads", 4))
+    # Scan items and process, largest first so one big archive does not start last and hold up the run
+    items = sorted(scan_files(base_dir, file_filter), key=operator.attrgetter("size"), reverse=True)
+    if not items:
+        logging.info(f"No files to organize in '{base_dir}'.")
+        return
+    jobs = plan_jobs(items, output_dir)
+    if not simulate:
+        # Only the files bound for a folder that could not be created are skipped
+        failed = ensure_directories_exist(job.folder for job in jobs)
+        for job in jobs:
+            if job.folder in failed:
+                logging.error(f"Failed to process {job.item.name}: destination {job.folder} is unavailable")
+        jobs = [job for job in jobs if job.folder not in failed]
+    worker = functools.partial(process_file, dispatch=build_dispatch(simulate, integrity, password, integrity_algo))
 
-    with concurrent.futures.ThreadPoolExecutor(max_threads) as executor:
-        list(
-            tqdm(
-                executor.map(lambda x: process_file(x, output_dir, simulate, integrity, password), items),
-                total=len(items),
-                desc="Processing Files"
-            )
-        )
+    # Decompression holds the GIL, so compressed archives go to processes; moves and plain tar
+    # extraction are I/O-bound and stay on threads, avoiding process start-up and pickling
+    cpu_jobs = [] if simulate else [job for job in jobs if job.kind in CPU_BOUND_ARCHIVES]
+    io_jobs = jobs if simulate else [job for job in jobs if job.kind not in CPU_BOUND_ARCHIVES]
+    process_workers, thread_workers = split_workers(cpu_jobs, io_jobs, config.get("max_threads", 4))
+    if not process_workers:
+        cpu_jobs, io_jobs = [], jobs
+    extract_threads = max(1, multiprocessing.cpu_count() // max(1, process_workers))
+
+    # Executors only start workers on the first submit, so a pool left without work costs nothing
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max(1, process_workers),
+        mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+        initializer=init_worker,
+        initargs=(extract_threads, LOG_QUEUE, logging.getLogger().level),
+    ) as process_pool, concurrent.futures.ThreadPoolExecutor(max(1, thread_workers)) as thread_pool:
+        # Progress advances as tasks complete; redraws are throttled so bursts of small files
+        # do not turn every completion into a terminal write
+        with tqdm(total=len(jobs), desc="Processing Files", mininterval=0.5) as progress:
+            for _ in submit_bounded(worker, [
+                (process_pool, cpu_jobs, process_workers * 4),
+                (thread_pool, io_jobs, thread_workers * 4),
+            ]):
+                progress.update()
 
 # Parse command-line arguments
 def parse_arguments() -> Dict: